@@ -1,16 +1,64 @@
 """This packaged adds xml support to :mod:`fastapi`."""
-from .openapi import add_openapi_extension
-from .response import XmlAppResponse
-from .response import XmlTextResponse
-from .route import XmlRoute
-from .xmlbody import XmlBody
+from typing import Any
 
 __all__ = [
     "XmlRoute",
     "XmlTextResponse",
     "XmlAppResponse",
+    "StreamingXmlResponse",
     "XmlBody",
     "add_openapi_extension",
+    "install_fast_loop",
 ]
 
 __version__ = "1.1.0"
+
+_LAZY_IMPORTS = {
+    "XmlRoute": "route",
+    "XmlTextResponse": "response",
+    "XmlAppResponse": "response",
+    "StreamingXmlResponse": "response",
+    "XmlBody": "xmlbody",
+    "add_openapi_extension": "openapi",
+}
+
+
+def install_fast_loop() -> bool:
+    """
+    The install_fast_loop function installs uvloop's event loop policy when
+    uvloop is importable. The request hot path is asyncio glue — body reads,
+    dependency resolution, response sends — so a faster loop benefits every
+    endpoint without any change to this package's code. The call is opt-in
+    and must happen before the application's event loop is created.
+
+    :return: True if uvloop was installed, False if it is unavailable
+    """
+    try:
+        import uvloop  # type: ignore[import-not-found]
+    except ImportError:
+        return False
+    import asyncio
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
+def __getattr__(name: str) -> Any:
+    """
+    The __getattr__ function lazily imports the package's public names on
+    first access (:pep:`562`). This keeps ``import fastapi_xml`` cheap: the
+    transitive fastapi, pydantic and xsdata imports are only paid by code
+    that actually uses them.
+
+    :param name: the attribute to resolve
+    :return: the resolved attribute
+    """
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    module = import_module(f".{module_name}", __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
@@ -1,49 +1,338 @@
-from dataclasses import asdict
+import asyncio
+import copy
+import hashlib
+import io
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import wraps
+from collections import OrderedDict
+from dataclasses import fields
 from dataclasses import is_dataclass
+from queue import Queue
 from typing import Any
 from typing import Callable
 from typing import ClassVar
 from typing import Dict
+from typing import Iterable
+from typing import List
 from typing import Optional
+from typing import get_args
+from typing import get_origin
+from typing import get_type_hints
+from typing import Tuple
+from typing import Type
+from typing import Union
 
 from fastapi._compat import ModelField
+from pydantic import TypeAdapter
+from starlette.concurrency import run_in_threadpool
 from starlette.requests import Request
 from xsdata.exceptions import ParserError
 from xsdata.formats.dataclass.context import XmlContext
 from xsdata.formats.dataclass.parsers import XmlParser
+from xsdata.formats.dataclass.parsers.handlers import default_handler
 
 DEFAULT_XML_CONTEXT: XmlContext = XmlContext()
+_tls = threading.local()
+
+
+def _get_parser() -> XmlParser:
+    """
+    The _get_parser function returns the XmlParser of the current thread,
+    constructing it on first use. XmlParser keeps per parse state such as the
+    namespace map, so a process wide instance is unsafe once decoding runs in
+    the threadpool; the immutable XmlContext is shared across all threads.
+
+    :return: the thread local XmlParser
+    """
+    parser: Optional[XmlParser] = getattr(_tls, "parser", None)
+    if parser is None:
+        parser = XmlParser(context=DEFAULT_XML_CONTEXT, handler=default_handler())
+        _tls.parser = parser
+    return parser
+
 
 __all__ = ["BodyDecodeError", "XmlDecoder"]
 
 
 class BodyDecodeError(ValueError):
-    pass
+    __slots__ = ()
 
 
-class XmlDecoder:
-    xml_parser_factory: ClassVar[Callable[[], XmlParser]] = lambda: XmlParser(
-        context=DEFAULT_XML_CONTEXT
+class _QueueReader(io.RawIOBase):
+    """A file like adapter that reads from a queue fed by the ASGI receive
+    stream.
+
+    The parser thread blocks on the queue while the event loop keeps
+    receiving body chunks, so network I/O and XML parsing interleave
+    and peak memory stays at chunk size instead of body size. A ``None``
+    item marks the end of the stream.
+    """
+
+    def __init__(self, chunks: "Queue[Optional[bytes]]") -> None:
+        super().__init__()
+        self._chunks = chunks
+        self._buffer = b""
+        self._eof = False
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        """
+        The read function returns up to size bytes, blocking on the queue
+        until enough data or the end of the stream arrived.
+
+        :param size: the maximum number of bytes to return, -1 for all
+        :return: the next bytes of the stream
+        """
+        while not self._eof and (size < 0 or len(self._buffer) < size):
+            chunk = self._chunks.get()
+            if chunk is None:
+                self._eof = True
+            else:
+                self._buffer += chunk
+        if size < 0:
+            data, self._buffer = self._buffer, b""
+        else:
+            data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+
+def _shallow_asdict(obj: Any) -> Any:
+    """
+    The _shallow_asdict function converts a dataclass instance into a mapping
+    for pydantic's constructor. Unlike :func:`dataclasses.asdict` it does not
+    deepcopy leaf values; immutable leaves such as strings and numbers are
+    referenced as is, which avoids one copy per field on every request.
+
+    :param obj: the object to convert
+    :return: a dict for dataclass instances, otherwise the object itself
+    """
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return {f.name: _shallow_asdict(getattr(obj, f.name)) for f in fields(obj)}
+    if isinstance(obj, (list, tuple)):
+        return [_shallow_asdict(v) for v in obj]
+    if isinstance(obj, dict):
+        return {k: _shallow_asdict(v) for k, v in obj.items()}
+    return obj
+
+
+def _maybe_profile(func: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    The _maybe_profile function wraps a callable with per call profiling when
+    the ``FASTAPI_XML_PROFILE`` environment variable is set at import time.
+    Calls slower than ``FASTAPI_XML_PROFILE_MS`` milliseconds (default 50)
+    dump a profile to ``/tmp``: a pyinstrument html flamegraph when
+    pyinstrument is installed, otherwise cProfile stats. Without the
+    environment variable the callable is returned unchanged, so the hot path
+    pays nothing.
+
+    :param func: the callable to wrap
+    :return: the wrapped callable, or func itself when profiling is off
+    """
+    if not os.environ.get("FASTAPI_XML_PROFILE"):
+        return func
+    threshold = float(os.environ.get("FASTAPI_XML_PROFILE_MS", "50")) / 1000.0
+
+    try:
+        from pyinstrument import Profiler  # type: ignore[import-not-found]
+    except ImportError:
+        Profiler = None
+
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        if Profiler is not None:
+            profiler = Profiler()
+            profiler.start()
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - started
+                profiler.stop()
+                if elapsed >= threshold:
+                    path = f"/tmp/xml_decode_{time.time_ns()}.html"
+                    with open(path, "w") as fp:
+                        fp.write(profiler.output_html())
+        else:
+            import cProfile
+
+            c_profiler = cProfile.Profile()
+            started = time.perf_counter()
+            try:
+                return c_profiler.runcall(func, *args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - started
+                if elapsed >= threshold:
+                    c_profiler.dump_stats(f"/tmp/xml_decode_{time.time_ns()}.prof")
+
+    return wrapper
+
+
+_LEAF_TYPES: Tuple[type, ...] = (str, int, float, bool, bytes)
+_walkers: Dict[type, Callable[[Any], Any]] = {}
+
+
+def _lazy_walker(clazz: type) -> Callable[[Any], Any]:
+    """
+    The _lazy_walker function returns a callable that resolves the generated
+    walker for clazz on first use. This late binding keeps the code
+    generation below safe for recursive dataclasses.
+
+    :param clazz: the dataclass the walker is generated for
+    :return: a callable converting an instance of clazz into a dict
+    """
+
+    def call(value: Any) -> Any:
+        walker = _walkers.get(clazz)
+        if walker is None:
+            walker = _build_walker(clazz)
+        return walker(value)
+
+    return call
+
+
+def _value_expr(var: str, tp: Any, env: Dict[str, Any]) -> str:
+    """
+    The _value_expr function emits the python expression converting one value
+    of the given annotated type for the generated walker source. Known leaf
+    types pass through untouched, nested dataclasses and typed containers
+    inline their converters, anything else falls back to the generic walker.
+
+    :param var: the expression holding the value
+    :param tp: the annotated type of the value
+    :param env: the globals of the generated function, extended as needed
+    :return: a python expression as string
+    """
+    origin = get_origin(tp)
+    if origin is Union:
+        non_none = [a for a in get_args(tp) if a is not type(None)]  # noqa: E721
+        if len(non_none) == 1:
+            inner = _value_expr(var, non_none[0], env)
+            if inner == var:
+                return var
+            return f"(None if {var} is None else {inner})"
+    elif origin in (list, tuple):
+        args = get_args(tp)
+        if args:
+            item = _value_expr("v", args[0], env)
+            if item == "v":
+                return f"list({var})"
+            return f"[{item} for v in {var}]"
+    elif origin is None:
+        if isinstance(tp, type) and is_dataclass(tp):
+            name = f"_walk{len(env)}"
+            env[name] = _lazy_walker(tp)
+            return f"{name}({var})"
+        if tp in _LEAF_TYPES:
+            return var
+    env["_fallback"] = _shallow_asdict
+    return f"_fallback({var})"
+
+
+def _build_walker(clazz: type) -> Callable[[Any], Any]:
+    """
+    The _build_walker function generates a straight-line to-dict function for
+    one dataclass and caches it. The generated source builds the dict literal
+    inline, so later calls run without any reflection over fields(). Classes
+    whose type hints cannot be resolved fall back to the generic walker.
+
+    :param clazz: the dataclass to generate a walker for
+    :return: a callable converting an instance of clazz into a dict
+    """
+    try:
+        hints = get_type_hints(clazz)
+    except Exception:
+        _walkers[clazz] = _shallow_asdict
+        return _shallow_asdict
+
+    env: Dict[str, Any] = {}
+    items = ", ".join(
+        f"{f.name!r}: {_value_expr(f'o.{f.name}', hints.get(f.name, Any), env)}"
+        for f in fields(clazz)
     )
-    xml_parser: ClassVar[Optional[XmlParser]] = None
+    source = "def _walker(o):\n    return {%s}\n" % items
+    exec(  # noqa: S102
+        compile(source, f"<fastapi_xml._walker[{clazz.__name__}]>", "exec"), env
+    )
+    walker: Callable[[Any], Any] = env["_walker"]
+    _walkers[clazz] = walker
+    return walker
+
+
+class XmlDecoder:
+    _class_parsers: ClassVar[Dict[type, Callable[[bytes], object]]] = {}
+    _class_validators: ClassVar[Dict[type, Callable[[Any], Any]]] = {}
+    decode_cache_size: ClassVar[int] = 128
+    threadpool_threshold: ClassVar[int] = 16 * 1024
+    #: Opt-in: declared body size at which generated handlers decode
+    #: straight from the ASGI stream instead of buffering the body. None,
+    #: the default, keeps every request on the buffered path; set a byte
+    #: threshold before building routes to enable streaming. Each stream
+    #: occupies a dedicated parser thread for its lifetime.
+    stream_threshold: ClassVar[Optional[int]] = None
+    max_body_bytes: ClassVar[int] = 8 * 1024 * 1024
+    _IS_DATACLASS_ATTR: ClassVar[str] = "_fastapi_xml_is_dataclass"
+    decode_cache_max_body: ClassVar[int] = 64 * 1024
+    _decode_cache: ClassVar[
+        "OrderedDict[Tuple[type, bytes], Dict[str, Any]]"
+    ] = OrderedDict()
+
+    @classmethod
+    def _field_is_dataclass(cls, model_field: ModelField) -> bool:
+        """
+        The _field_is_dataclass function memoizes the is_dataclass check for
+        a model field. The flag is stored on the field itself, so the cache
+        lives exactly as long as the route owning the field.
+
+        :param model_field: the model field to check
+        :return: True if the field type is a dataclass
+        """
+        cached: Optional[bool] = getattr(model_field, cls._IS_DATACLASS_ATTR, None)
+        if cached is None:
+            cached = is_dataclass(model_field.type_)
+            setattr(model_field, cls._IS_DATACLASS_ATTR, cached)
+        return cached
 
     @classmethod
-    def get_parser(cls) -> XmlParser:
+    def _get_class_parser(cls, clazz: type) -> Callable[[bytes], object]:
         """
-        The get_parser function is a class method that returns an instance of
-        the XmlParser class. The first time it is called, it creates an
-        instance and stores it in the xml_parser attribute. Subsequent calls
-        return this same object.
+        The _get_class_parser function returns a parse callable specialized
+        for one dataclass. On first use it forces the XmlContext to build the
+        class metadata, so later calls skip both the metadata construction
+        and the per-call keyword binding of clazz.
 
-        :return: An instance of XmlParser
+        :param clazz: the dataclass to parse into
+        :return: a callable turning xml bytes into an instance of clazz
         """
-        if cls.xml_parser is None:
-            cls.xml_parser = cls.xml_parser_factory()
-        return cls.xml_parser
+        parse = cls._class_parsers.get(clazz)
+        if parse is None:
+            DEFAULT_XML_CONTEXT.build(clazz)
+
+            def parse(
+                body: bytes,
+                _get_parser: Callable[[], XmlParser] = _get_parser,
+                _clazz: type = clazz,
+            ) -> object:
+                return _get_parser().parse(io.BytesIO(body), _clazz)
+
+            cls._class_parsers[clazz] = parse
+        return parse
 
     @classmethod
+    @_maybe_profile
     def decode(
-        cls, request: Request, model_field: ModelField, body: bytes
+        cls,
+        request: Request,
+        model_field: ModelField,
+        body: bytes,
+        *,
+        _ParserError: "Type[ParserError]" = ParserError,
+        _walkers: Dict[type, Callable[[Any], Any]] = _walkers,
+        _blake2b: Callable[..., Any] = hashlib.blake2b,
     ) -> Optional[Dict[str, Any]]:
         """
         This method decodes an xml body.
@@ -52,18 +341,279 @@ class XmlDecoder:
         :param model_field:   the model field to deal with
         :param body:    the original http body
 
+        The underscore keywords pre-bind hot globals as locals, turning
+        a LOAD_GLOBAL per request into a LOAD_FAST; they are not part of
+        the public interface.
+
+        :return: The Decoder MUST return None, if the decoding failed for any reason.
+                Else, it MUST return a mapping for pydantic's constructor
+        """
+        clazz = model_field.type_
+        if not cls._field_is_dataclass(model_field):
+            return None
+
+        if len(body) > cls.max_body_bytes:
+            raise BodyDecodeError("body too large")
+
+        cache_key: Optional[Tuple[type, bytes]] = None
+        if 0 < len(body) <= cls.decode_cache_max_body and cls.decode_cache_size > 0:
+            digest = _blake2b(body, digest_size=16).digest()
+            cache_key = (clazz, digest)
+            cached = cls._decode_cache.get(cache_key)
+            if cached is not None:
+                try:
+                    cls._decode_cache.move_to_end(cache_key)
+                except KeyError:
+                    # Another thread's eviction may race between the get
+                    # and the recency bump; the hit itself is still valid.
+                    pass
+                # A deep copy, since a shallow one would still share the
+                # nested containers with every later hit.
+                return copy.deepcopy(cached)
+
+        try:
+            result: object = cls._get_class_parser(clazz)(body)
+        except _ParserError as e:
+            raise BodyDecodeError(*e.args) from e
+        except Exception as e:
+            # xsdata raises plain TypeError/ValueError when a well formed
+            # document fails to bind, e.g. a missing required element;
+            # those are client errors, not server bugs.
+            raise BodyDecodeError(str(e)) from e
+
+        walker = _walkers.get(clazz)
+        if walker is None:
+            walker = _build_walker(clazz)
+        decoded: Dict[str, Any] = walker(result)
+        if cache_key is not None:
+            # The cache keeps its own copy; the mapping handed to the
+            # caller may be mutated downstream.
+            cls._decode_cache[cache_key] = copy.deepcopy(decoded)
+            if len(cls._decode_cache) > cls.decode_cache_size:
+                cls._decode_cache.popitem(last=False)
+        return decoded
+
+    @classmethod
+    def decode_into_pydantic(
+        cls, request: Request, model_field: ModelField, body: bytes
+    ) -> Optional[Any]:
+        """
+        This method decodes an xml body straight into a validated instance.
+        Instead of converting the parsed dataclass into a dict for pydantic's
+        constructor, the object is handed to pydantic-core's validator
+        directly, which skips one full dict materialization per request.
+        Callers using this path must not run the mapping based validation
+        again.
+
+        :param request: the original request
+        :param model_field: the model field to deal with
+        :param body: the original http body
+
+        :return: The Decoder MUST return None, if the decoding failed for any reason.
+                Else, it MUST return the validated model instance
+        """
+        clazz = model_field.type_
+        if not cls._field_is_dataclass(model_field):
+            return None
+
+        try:
+            result: object = cls._get_class_parser(clazz)(body)
+        except ParserError as e:
+            raise BodyDecodeError(*e.args) from e
+        except Exception as e:
+            raise BodyDecodeError(str(e)) from e
+
+        validator = cls._class_validators.get(clazz)
+        if validator is None:
+            validator = TypeAdapter(clazz).validate_python
+            cls._class_validators[clazz] = validator
+        return validator(result)
+
+    @classmethod
+    def warmup(cls, classes: Iterable[type]) -> None:
+        """
+        The warmup function builds the parser metadata for the given classes
+        ahead of time. XmlContext resolves fields, generics and namespaces
+        lazily on the first parse of each class, so without warmup the first
+        request per endpoint pays a reflection heavy metadata pass.
+
+        :param classes: the dataclasses to prebuild; non dataclasses are skipped
+        """
+        for clazz in classes:
+            if is_dataclass(clazz):
+                cls._get_class_parser(clazz)
+
+    @classmethod
+    def decode_batch(cls, bodies: List[bytes], clazz: type) -> List[Dict[str, Any]]:
+        """
+        This method decodes several xml bodies of the same class in one go.
+        The parser metadata and the generated walker are resolved once and
+        amortized over the whole batch. Batches of four or more documents
+        fan out to a thread pool when the lxml handler is active, since
+        libxml2 releases the GIL during the parse.
+
+        :param bodies: the xml documents to decode
+        :param clazz: the dataclass all documents parse into
+
+        :return: one mapping per body, in input order
+        """
+        parse = cls._get_class_parser(clazz)
+        walker = _walkers.get(clazz)
+        if walker is None:
+            walker = _build_walker(clazz)
+
+        def decode_one(body: bytes) -> Dict[str, Any]:
+            try:
+                result = parse(body)
+            except ParserError as e:
+                raise BodyDecodeError(*e.args) from e
+            except Exception as e:
+                raise BodyDecodeError(str(e)) from e
+            return walker(result)
+
+        if len(bodies) >= 4 and default_handler().__name__ == "LxmlEventHandler":
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+                return list(pool.map(decode_one, bodies))
+        return [decode_one(body) for body in bodies]
+
+    @classmethod
+    def decode_to_json_bytes(cls, body: bytes, clazz: type) -> bytes:
+        """
+        This method decodes an xml body and serializes it straight to JSON
+        bytes. For XML-in/JSON-out endpoints this skips the intermediate dict
+        entirely when orjson is installed, since orjson serializes
+        dataclasses natively; without orjson the shallow dict is encoded with
+        the stdlib json module.
+
+        :param body: the original http body
+        :param clazz: the dataclass to parse into
+
+        :return: the decoded body as JSON bytes
+        """
+        try:
+            result: object = cls._get_class_parser(clazz)(body)
+        except ParserError as e:
+            raise BodyDecodeError(*e.args) from e
+        except Exception as e:
+            raise BodyDecodeError(str(e)) from e
+
+        try:
+            import orjson
+        except ImportError:
+            import json
+
+            return json.dumps(_shallow_asdict(result)).encode("utf-8")
+        return orjson.dumps(result, option=orjson.OPT_SERIALIZE_DATACLASS)
+
+    @classmethod
+    async def decode_async(
+        cls, request: Request, model_field: ModelField, body: bytes
+    ) -> Optional[Dict[str, Any]]:
+        """
+        This method decodes an xml body without blocking the event loop on
+        large payloads. Bodies below :attr:`threadpool_threshold` are decoded
+        inline, since a threadpool dispatch would cost more than the parse
+        itself; larger bodies are offloaded to starlette's threadpool so
+        concurrent requests keep being served.
+
+        :param request: the original request
+        :param model_field: the model field to deal with
+        :param body: the original http body
+
+        :return: The Decoder MUST return None, if the decoding failed for any reason.
+                Else, it MUST return a mapping for pydantic's constructor
+        """
+        if len(body) < cls.threadpool_threshold:
+            return cls.decode(request, model_field, body)
+        return await run_in_threadpool(cls.decode, request, model_field, body)
+
+    @classmethod
+    async def decode_stream(
+        cls, request: Request, model_field: ModelField
+    ) -> Optional[Dict[str, Any]]:
+        """
+        This method decodes an xml body directly from the ASGI receive
+        stream. Instead of buffering the whole body via request.body(), the
+        chunks are handed to a parser running in a dedicated thread, so
+        parsing starts while the body is still arriving. The parser blocks
+        on the queue while waiting for data, so it must never occupy a
+        thread of the shared threadpool: with enough concurrent streams the
+        pool's limiter would hold only blocked parsers and starve the puts
+        they wait for. The chunks are enqueued straight from the event loop
+        without blocking; the queue is unbounded, with resident memory
+        capped by :attr:`max_body_bytes`, which is checked against the
+        declared content-length and the cumulative streamed size like on
+        the buffered path.
+
+        :param request: the original request
+        :param model_field: the model field to deal with
 
         :return: The Decoder MUST return None, if the decoding failed for any reason.
                 Else, it MUST return a mapping for pydantic's constructor
         """
-        xml_parser = cls.get_parser()
         clazz = model_field.type_
-        if not is_dataclass(clazz):
+        if not cls._field_is_dataclass(model_field):
             return None
 
+        content_length = request.headers.get("content-length")
+        if content_length is not None and content_length.isdigit():
+            if int(content_length) > cls.max_body_bytes:
+                raise BodyDecodeError("body too large")
+
+        chunks: "Queue[Optional[bytes]]" = Queue()
+        reader = _QueueReader(chunks)
+        loop = asyncio.get_running_loop()
+        parse_future: "asyncio.Future[object]" = loop.create_future()
+
+        def _deliver(deliver: Callable[[Any], None], value: Any) -> None:
+            if not parse_future.done():
+                deliver(value)
+
+        def _parse_stream() -> None:
+            try:
+                result: Any = _get_parser().parse(reader, clazz)
+            except Exception as e:
+                loop.call_soon_threadsafe(_deliver, parse_future.set_exception, e)
+            else:
+                loop.call_soon_threadsafe(_deliver, parse_future.set_result, result)
+
+        threading.Thread(
+            target=_parse_stream, name="fastapi-xml-decode-stream", daemon=True
+        ).start()
+
+        total = 0
+        stream_error: Optional[BaseException] = None
+        try:
+            async for chunk in request.stream():
+                if parse_future.done():
+                    break
+                if chunk:
+                    total += len(chunk)
+                    if total > cls.max_body_bytes:
+                        raise BodyDecodeError("body too large")
+                    chunks.put_nowait(chunk)
+        except BaseException as e:
+            # Kept until the parser settles: its consequential EOF error
+            # must not shadow the size violation or transport failure.
+            stream_error = e
+        finally:
+            # Always deliver the end sentinel so the parser thread cannot
+            # stay blocked on the queue.
+            chunks.put_nowait(None)
+
         try:
-            result: object = xml_parser.from_bytes(body, clazz=clazz)
+            result = await parse_future
         except ParserError as e:
+            if stream_error is not None:
+                raise stream_error
+            raise BodyDecodeError(*e.args) from e
+        except Exception as e:
+            if stream_error is not None:
+                raise stream_error
             raise BodyDecodeError(str(e)) from e
-        else:
-            return asdict(result)  # type: ignore
+        if stream_error is not None:
+            raise stream_error
+        walker = _walkers.get(clazz)
+        if walker is None:
+            walker = _build_walker(clazz)
+        return walker(result)
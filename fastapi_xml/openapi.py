@@ -1,18 +1,20 @@
 from dataclasses import Field
 from dataclasses import fields
 from dataclasses import is_dataclass
+from functools import lru_cache
 from types import MethodType
 from typing import Any
 from typing import Callable
+from typing import Collection
 from typing import Dict
 from typing import List
 from typing import Mapping
 from typing import Optional
+from typing import Tuple
 from typing import Type
 from typing import TYPE_CHECKING
 
 from fastapi import FastAPI
-from fastapi.encoders import jsonable_encoder
 from fastapi.openapi.models import Components
 from fastapi.openapi.models import Schema
 from fastapi.openapi.models import XML
@@ -25,11 +27,31 @@ from xsdata.formats.dataclass.models.elements import XmlType
 
 from .decoder import DEFAULT_XML_CONTEXT
 
+if TYPE_CHECKING:  # pragma: nocover
+    from pydantic.dataclasses import PydanticDataclass
+
 OpenApiSchemaModifier = Callable[[FastAPI, OpenAPI, Optional[Mapping[str, Any]]], bool]
 OPENAPI_SCHEMA_MODIFIER: List[OpenApiSchemaModifier] = []
 
-if TYPE_CHECKING:  # pragma: nocover
-    from pydantic.dataclasses import PydanticDataclass
+_XML_SCHEMA_CACHE: Dict[Any, Schema] = {}
+_JSON_SCHEMA_CACHE: Dict[type, Dict[str, Any]] = {}
+
+
+def clear_openapi_cache() -> None:
+    """Reset the module level schema caches, mainly for tests."""
+    _XML_SCHEMA_CACHE.clear()
+    _JSON_SCHEMA_CACHE.clear()
+    _to_pydantic_dataclass.cache_clear()
+
+
+@lru_cache(maxsize=None)
+def _to_pydantic_dataclass(tp: type) -> Type["PydanticDataclass"]:
+    """Wrap a dataclass as a pydantic dataclass, once per class.
+
+    :param tp: the plain dataclass type
+    :return: the pydantic dataclass for tp
+    """
+    return pydantic_dataclass(tp)
 
 
 def _get_element_name_generator(meta: "Type[object]") -> Callable[[str], str]:
@@ -77,8 +99,10 @@ def _add_model_schema(
     """
     model_meta = getattr(dclazz, "Meta", type)
     namespace = getattr(model_meta, "namespace", None)
-    prefix = None if not isinstance(namespace, str) else ns_map.get(namespace)
-    xml_schema = XML(
+    prefix = ns_map.get(namespace) if type(namespace) is str else None
+    # model_construct skips validation; all values here are produced
+    # internally and known to be valid.
+    xml_schema = XML.model_construct(
         name=getattr(model_meta, "name", dclazz.__name__),
         namespace=namespace,
         prefix=prefix,
@@ -97,12 +121,12 @@ def _is_xml_schema_empty(xml_schema: XML) -> bool:
     :return: True if the xml schema is empty
     """
     return (
-        xml_schema.name is None
-        and xml_schema.namespace is None
-        and xml_schema.prefix is None
-        and xml_schema.attribute is None
-        and xml_schema.wrapped is None
-    )
+        xml_schema.name,
+        xml_schema.namespace,
+        xml_schema.prefix,
+        xml_schema.attribute,
+        xml_schema.wrapped,
+    ) == (None, None, None, None, None)
 
 
 def _switch_ref_to_all_of(prop: Schema, xml_schema: XML) -> None:
@@ -119,7 +143,7 @@ def _switch_ref_to_all_of(prop: Schema, xml_schema: XML) -> None:
     if not _is_xml_schema_empty(xml_schema):
         prop.xml = xml_schema
         if prop.ref is not None:
-            prop.allOf = [Schema(**{"$ref": prop.ref})]  # type: ignore
+            prop.allOf = [Schema.model_construct(ref=prop.ref)]
             prop.ref = None
 
 
@@ -128,6 +152,9 @@ def _add_field_schema(
     model_field: Field[Any],
     model_schema: Schema,
     ns_map: Mapping[str, str],
+    name_generators: Optional[
+        Tuple[Callable[[str], str], Callable[[str], str]]
+    ] = None,
 ) -> None:
     """
     The _add_field_schema function is responsible for adding the XML schema
@@ -138,11 +165,12 @@ def _add_field_schema(
     :param model_field: The data field currently in focus.
     :param model_schema: Schema: Pass the schema of for dclazz.
     :param ns_map: Map a namespace to a prefix
+    :param name_generators: The (attribute, element) name generator pair,
+        hoisted once per model by the caller; resolved from dclazz if omitted
     """
     if model_schema.properties is None:
         return
 
-    model_meta = getattr(dclazz, "Meta", type)
     prop = model_schema.properties[model_field.name]
     assert isinstance(prop, Schema)
 
@@ -150,12 +178,24 @@ def _add_field_schema(
     is_attribute = model_field.metadata.get("type") == XmlType.ATTRIBUTE
     meta_name = model_field.metadata.get("name")
     wrapper_name = model_field.metadata.get("wrapper")
-    prefix = None if not isinstance(namespace, str) else ns_map.get(namespace)
-    name_gen = (
-        _get_attribute_name_generator(model_meta)
-        if is_attribute
-        else _get_element_name_generator(model_meta)
-    )
+    if (
+        namespace is None
+        and not is_attribute
+        and meta_name is None
+        and wrapper_name is None
+        and prop.type != "array"
+    ):
+        # No xml metadata and no item schema to adjust: the field would
+        # contribute an empty XML object, so skip building it.
+        return
+    prefix = ns_map.get(namespace) if type(namespace) is str else None
+    if name_generators is None:
+        model_meta = getattr(dclazz, "Meta", type)
+        name_generators = (
+            _get_attribute_name_generator(model_meta),
+            _get_element_name_generator(model_meta),
+        )
+    name_gen = name_generators[0] if is_attribute else name_generators[1]
 
     if wrapper_name is None:
         field_name = name_gen(meta_name) if meta_name is not None else None
@@ -170,7 +210,7 @@ def _add_field_schema(
             f"{prop.type}"
         )
 
-    xml_schema = XML(
+    xml_schema = XML.model_construct(
         name=field_name,
         namespace=namespace,
         prefix=prefix,
@@ -187,7 +227,7 @@ def _add_field_schema(
             )
         _switch_ref_to_all_of(
             prop.items,
-            XML(
+            XML.model_construct(
                 name=array_name,
                 namespace=None,
                 prefix=None,
@@ -197,6 +237,38 @@ def _add_field_schema(
         )
 
 
+def _iter_route_models(
+    app: FastAPI, schema_names: Collection[str]
+) -> List[Type["PydanticDataclass"]]:
+    """
+    The _iter_route_models function collects the dataclasses used as route
+    parameters or response bodies whose name appears in the given schema
+    name collection.
+
+    :param app: Access the routes of the api
+    :param schema_names: The names present in the OpenAPI schema components
+    :return: A list of pydantic dataclasses
+    """
+    # The fingerprint holds the route objects themselves rather than their
+    # ids; a dropped route whose id gets reused by a new one would make an
+    # id based fingerprint match a changed route list.
+    fingerprint = (tuple(app.routes), frozenset(schema_names))
+    cached = getattr(app, "_fastapi_xml_route_models", None)
+    if cached is not None and cached[0] == fingerprint:
+        models: List[Type["PydanticDataclass"]] = cached[1]
+        return models
+
+    models = [
+        _to_pydantic_dataclass(field.type_)
+        for field in get_fields_from_routes(app.routes)
+        if is_dataclass(field.type_) and field.type_.__name__ in schema_names
+    ]
+    # The cache lives on the app instance instead of a module level mapping,
+    # so it cannot outlive the app.
+    app._fastapi_xml_route_models = (fingerprint, models)  # type: ignore[attr-defined]
+    return models
+
+
 def _get_route_models(
     app: FastAPI, openapi: OpenAPI
 ) -> List[Type["PydanticDataclass"]]:
@@ -211,16 +283,48 @@ def _get_route_models(
     if isinstance(openapi.components, Components) and isinstance(
         openapi.components.schemas, dict
     ):
-        return [
-            pydantic_dataclass(field.type_)
-            for field in get_fields_from_routes(app.routes)
-            if is_dataclass(field.type_)
-            and field.type_.__name__ in openapi.components.schemas
-        ]
+        return _iter_route_models(app, openapi.components.schemas)
     else:  # pragma: nocover
         return []
 
 
+def _build_model_xml_schema(
+    model: Type["PydanticDataclass"], ns_map: Mapping[str, str]
+) -> Schema:
+    """
+    The _build_model_xml_schema function runs the whole per model pipeline:
+    json schema generation, model level and field level xml annotations. The
+    result is cached per model and namespace map, so dataclasses shared
+    across routes or rebuilt schemas pay the pipeline only once.
+
+    :param model: A pydantic dataclass to build the schema for.
+    :param ns_map: Map a namespace to a prefix
+    :return: The fully annotated schema for model
+    """
+    key = (model, tuple(sorted(ns_map.items())))
+    schema = _XML_SCHEMA_CACHE.get(key)
+    if schema is not None:
+        return schema
+
+    json_schema = _JSON_SCHEMA_CACHE.get(model)
+    if json_schema is None:
+        json_schema = TypeAdapter(model).json_schema(
+            by_alias=True, ref_template="#/components/schemas/{model}"
+        )
+        _JSON_SCHEMA_CACHE[model] = json_schema
+    schema = Schema.model_validate(json_schema)
+    _add_model_schema(model, schema, ns_map)
+    model_meta = getattr(model, "Meta", type)
+    name_generators = (
+        _get_attribute_name_generator(model_meta),
+        _get_element_name_generator(model_meta),
+    )
+    for field in fields(model):
+        _add_field_schema(model, field, schema, ns_map, name_generators)
+    _XML_SCHEMA_CACHE[key] = schema
+    return schema
+
+
 def add_openapi_xml_schema(
     app: FastAPI, openapi: OpenAPI, ns_map: Optional[Mapping[str, str]] = None
 ) -> bool:
@@ -242,22 +346,14 @@ def add_openapi_xml_schema(
     model_counter = 0
     field_counter = 0
     for model in flat_models:
-        schema = Schema(
-            **TypeAdapter(model).json_schema(
-                by_alias=True, ref_template="#/components/schemas/{model}"
-            )
-        )
+        schema = _build_model_xml_schema(model, ns_map)
         openapi.components.schemas[model.__name__] = schema
-        _add_model_schema(model, schema, ns_map)
         model_counter += 1
-
-        for field in fields(model):
-            _add_field_schema(model, field, schema, ns_map)
-            field_counter += 1
+        field_counter += len(fields(model))
     return model_counter > 0 and field_counter > 0
 
 
-def _get_unmodified_openapi(app: FastAPI) -> OpenAPI:
+def _get_unmodified_openapi(app: FastAPI) -> Dict[str, Any]:
     """
     .. testsetup::
 
@@ -280,10 +376,10 @@ def _get_unmodified_openapi(app: FastAPI) -> OpenAPI:
      .. doctest:: schema unchanged
 
         >>> a = app.openapi()
-        >>> b = _get_unmodified_openapi(app).model_dump(exclude_none=True, by_alias=True)
+        >>> b = _get_unmodified_openapi(app)
         >>> assert a == b
     """
-    openapi_schema = get_openapi(
+    return get_openapi(
         title=app.title,
         version=app.version,
         openapi_version=app.openapi_version,
@@ -295,7 +391,6 @@ def _get_unmodified_openapi(app: FastAPI) -> OpenAPI:
         tags=app.openapi_tags,
         servers=app.servers,
     )
-    return OpenAPI(**openapi_schema)
 
 
 def _extend_openapi(app: FastAPI, **extension_kwargs: Any) -> Dict[str, Any]:
@@ -328,11 +423,21 @@ def _extend_openapi(app: FastAPI, **extension_kwargs: Any) -> Dict[str, Any]:
     """
     if app.openapi_schema is not None:
         return app.openapi_schema
-    openapi = _get_unmodified_openapi(app)
-
-    add_openapi_xml_schema(app, openapi, extension_kwargs)
+    openapi_schema = _get_unmodified_openapi(app)
+
+    # get_openapi already returns a jsonable encoded document, so the xml
+    # schemas are injected into the dict directly instead of re-validating
+    # the whole document into an OpenAPI model and re-encoding it.
+    schemas = openapi_schema.get("components", {}).get("schemas")
+    if isinstance(schemas, dict):
+        ns_map = extension_kwargs or {}
+        for model in _iter_route_models(app, schemas):
+            schema = _build_model_xml_schema(model, ns_map)
+            schemas[model.__name__] = schema.model_dump(
+                exclude_none=True, by_alias=True
+            )
 
-    app.openapi_schema = jsonable_encoder(openapi, by_alias=True, exclude_none=True)
+    app.openapi_schema = openapi_schema
     return app.openapi_schema
 
 
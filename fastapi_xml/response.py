@@ -1,10 +1,24 @@
+import asyncio
+import io
+import threading
+from collections import OrderedDict
+from queue import Full
+from queue import Queue
 from typing import Any
+from typing import AsyncIterator
 from typing import Callable
 from typing import ClassVar
 from typing import Dict
+from typing import List
+from typing import Mapping
 from typing import Optional
+from typing import Protocol
+from typing import Type
 
 from fastapi.responses import JSONResponse
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
+from starlette.concurrency import run_in_threadpool
 from xsdata.formats.dataclass.serializers import XmlSerializer
 
 from .decoder import DEFAULT_XML_CONTEXT
@@ -13,10 +27,108 @@ __all__ = [
     "XmlResponse",
     "XmlAppResponse",
     "XmlTextResponse",
+    "StreamingXmlResponse",
 ]
 
 NS_MAP: Dict[Optional[str], str] = {}
 
+_SERIALIZERS: Dict[type, XmlSerializer] = {}
+
+_RENDER_CACHE: "OrderedDict[Any, bytes]" = OrderedDict()
+
+
+class _SerializerOwner(Protocol):
+    """The class level interface shared by the response classes that build
+    their serializer through a factory."""
+
+    xml_serializer_factory: ClassVar[Callable[[], XmlSerializer]]
+
+
+def _get_class_serializer(cls: Type[_SerializerOwner]) -> XmlSerializer:
+    """Return the serializer cached for the given response class, building it
+    through the class factory on first use.
+
+    :param cls: the response class requesting a serializer
+    :return: The serializer for the class
+    """
+    serializer = _SERIALIZERS.get(cls)
+    if serializer is None:
+        serializer = getattr(cls, "serializer", None) or cls.xml_serializer_factory()
+        _SERIALIZERS[cls] = serializer
+    return serializer
+
+
+class _QueueWriter(io.TextIOBase):
+    """A text sink handed to the serializer that pushes the written data into
+    a queue as utf-8 encoded chunks of bounded size.
+
+    The serializer backend may write either str or bytes. A ``None``
+    sentinel marks the end of the document. The abort event unblocks
+    the writer when the consumer goes away before the document ends.
+    """
+
+    def __init__(
+        self,
+        queue: "Queue[Optional[bytes]]",
+        chunk_size: int,
+        abort: threading.Event,
+    ) -> None:
+        super().__init__()
+        self._queue = queue
+        self._buffer: List[bytes] = []
+        self._size = 0
+        self._chunk_size = chunk_size
+        self._abort = abort
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        """Buffer the given data and emit a chunk once enough is collected.
+
+        :param data: the str or bytes written by the serializer
+        :return: the number of units consumed
+        """
+        chunk = data.encode("utf-8") if isinstance(data, str) else bytes(data)
+        self._buffer.append(chunk)
+        self._size += len(chunk)
+        if self._size >= self._chunk_size:
+            self._emit()
+        return len(data)
+
+    def flush(self) -> None:
+        """The serializer may flush its stream; chunking makes it a no-op."""
+
+    def close(self) -> None:
+        """Emit the remaining buffer followed by the end sentinel.
+
+        The sentinel is enqueued even if emitting fails, so the
+        consumer never blocks forever on a failed serialization. The
+        base close flag makes a second close, e.g. from IOBase.__del__,
+        a no-op.
+        """
+        if self.closed:
+            return
+        try:
+            self._emit()
+        finally:
+            self._put(None)
+            super().close()
+
+    def _emit(self) -> None:
+        if self._buffer:
+            self._put(b"".join(self._buffer))
+            self._buffer.clear()
+            self._size = 0
+
+    def _put(self, item: Optional[bytes]) -> None:
+        while not self._abort.is_set():
+            try:
+                self._queue.put(item, timeout=1.0)
+                return
+            except Full:
+                continue
+
 
 class XmlResponse(JSONResponse):
     """fastapi.openapi.utils.get_openapi_path does not support any
@@ -27,32 +139,99 @@ class XmlResponse(JSONResponse):
         Callable[[], XmlSerializer]
     ] = lambda: XmlSerializer(context=DEFAULT_XML_CONTEXT)
     serializer: ClassVar[Optional[XmlSerializer]] = None
+    #: Number of rendered documents the opt-in render cache holds. 0 (the
+    #: default) disables the cache; enable it by subclassing with a size
+    #: for endpoints whose payloads repeat across requests. Only content
+    #: with hashable field values is cached.
+    render_cache_size: ClassVar[int] = 0
+
+    def __init__(
+        self,
+        content: Any,
+        status_code: int = 200,
+        headers: Optional[Mapping[str, str]] = None,
+        media_type: Optional[str] = None,
+        background: Optional[BackgroundTask] = None,
+        ns_map: Optional[Dict[Optional[str], str]] = None,
+    ) -> None:
+        """
+        :param content: the object to serialize
+        :param status_code: the HTTP status code of the response
+        :param headers: additional response headers
+        :param media_type: overrides the class level media type
+        :param background: a task to run after the response is sent
+        :param ns_map: a namespace prefix-URI map for this response;
+            defaults to the module level NS_MAP
+
+        The base signature is spelled out rather than forwarded through
+        ``**kwargs`` because fastapi inspects it for the status_code
+        default when building the OpenAPI schema.
+        """
+        # render() runs inside the base __init__, so the namespace map must
+        # be bound first.
+        self._ns_map = ns_map if ns_map is not None else NS_MAP
+        super().__init__(content, status_code, headers, media_type, background)
 
     @classmethod
     def get_serializer(cls) -> XmlSerializer:
         """
         The get_serializer function is a class method that returns an instance
-        of the XmlSerializer class. The first time it is called, it creates an
-        instance and stores it in the serializer attribute of the class.
-        Subsequent calls return this same object.
+        of the XmlSerializer class. The first time it is called on a class, it
+        creates an instance through xml_serializer_factory and caches it per
+        class. Subsequent calls return this same object.
+
+        The cache is keyed on cls so a subclass with its own factory
+        gets its own serializer instead of aliasing the one cached by
+        the first class that happened to be used.
 
         :return: The serializer for the class
         """
-        if cls.serializer is None:
-            cls.serializer = cls.xml_serializer_factory()
-        return cls.serializer
+        return _get_class_serializer(cls)
 
     def render(self, content: Any) -> bytes:
         """
         The render function is responsible for taking the content and
-        serializing it into a string. The render function should return a bytes
-        object, not a str.
+        serializing it into a byte string. The serializer writes into a utf-8
+        text wrapper around a bytes buffer, so the document is encoded
+        incrementally instead of materializing the full xml string first and
+        re-encoding it.
+
+        When :attr:`render_cache_size` is positive, rendered documents
+        are memoized on the content's field values, so repeated payloads
+        skip the serialization entirely. Content with unhashable field
+        values silently bypasses the cache.
 
         :param content: Any: Pass the data to be serialized
         :return: A xml serialized byte string
         """
+        cache_key: Any = None
+        if self.render_cache_size > 0:
+            cache_key = (
+                type(self),
+                type(content),
+                tuple(vars(content).items()) if hasattr(content, "__dict__") else content,
+                tuple(self._ns_map.items()),
+            )
+            try:
+                cached = _RENDER_CACHE.get(cache_key)
+            except TypeError:
+                cache_key = None
+            else:
+                if cached is not None:
+                    _RENDER_CACHE.move_to_end(cache_key)
+                    return cached
+
         serializer = self.get_serializer()
-        return serializer.render(content, ns_map=NS_MAP).encode("utf-8")
+        buffer = io.BytesIO()
+        wrapper = io.TextIOWrapper(buffer, encoding="utf-8")
+        serializer.write(wrapper, content, ns_map=self._ns_map)
+        wrapper.flush()
+        body = buffer.getvalue()
+        if cache_key is not None:
+            _RENDER_CACHE[cache_key] = body
+            if len(_RENDER_CACHE) > self.render_cache_size:
+                _RENDER_CACHE.popitem(last=False)
+        return body
 
 
 class XmlTextResponse(XmlResponse):
@@ -61,3 +240,75 @@ class XmlTextResponse(XmlResponse):
 
 class XmlAppResponse(XmlResponse):
     media_type: str = "application/xml"
+
+
+class StreamingXmlResponse(StreamingResponse):
+    """Streams the serialized xml document chunk by chunk.
+
+    Serialization runs in a worker thread that feeds a bounded queue,
+    so peak memory stays at one chunk instead of the whole payload and
+    serialization overlaps with sending.
+    """
+
+    media_type: str = "application/xml"
+    chunk_size: ClassVar[int] = 64 * 1024
+    xml_serializer_factory: ClassVar[
+        Callable[[], XmlSerializer]
+    ] = lambda: XmlSerializer(context=DEFAULT_XML_CONTEXT)
+
+    def __init__(
+        self,
+        content: Any,
+        status_code: int = 200,
+        headers: Optional[Mapping[str, str]] = None,
+        media_type: Optional[str] = None,
+        background: Optional[BackgroundTask] = None,
+        ns_map: Optional[Dict[Optional[str], str]] = None,
+    ) -> None:
+        """
+        :param content: the object to serialize
+        :param status_code: the HTTP status code of the response
+        :param headers: additional response headers
+        :param media_type: overrides the class level media type
+        :param background: a task to run after the response is sent
+        :param ns_map: a namespace prefix-URI map for this response;
+            defaults to the module level NS_MAP
+        """
+        stream = self._render_stream(
+            content, ns_map if ns_map is not None else NS_MAP
+        )
+        super().__init__(stream, status_code, headers, media_type, background)
+
+    async def _render_stream(
+        self, content: Any, ns_map: Dict[Optional[str], str]
+    ) -> AsyncIterator[bytes]:
+        """Serialize the content in a worker thread and yield the encoded
+        chunks as they become available.
+
+        :param content: the object to serialize
+        :param ns_map: the namespace prefix-URI map for this response
+        """
+        chunks: "Queue[Optional[bytes]]" = Queue(maxsize=2)
+        abort = threading.Event()
+        serializer = _get_class_serializer(type(self))
+        chunk_size = self.chunk_size
+
+        def _serialize() -> None:
+            writer = _QueueWriter(chunks, chunk_size, abort)
+            try:
+                serializer.write(writer, content, ns_map=ns_map)
+            finally:
+                # close() always delivers the sentinel, so the consumer
+                # wakes up and collects the error from the task below.
+                writer.close()
+
+        serialize_task = asyncio.ensure_future(run_in_threadpool(_serialize))
+        try:
+            while True:
+                chunk = await run_in_threadpool(chunks.get)
+                if chunk is None:
+                    break
+                yield chunk
+        finally:
+            abort.set()
+            await serialize_task
@@ -1,9 +1,17 @@
 import asyncio
+import logging
+import time
+from collections import OrderedDict
 from contextlib import AsyncExitStack
+from functools import partial
 from typing import Any
 from typing import Callable
+from typing import cast
+from typing import ClassVar
 from typing import Coroutine
 from typing import Dict
+from typing import List
+from typing import NoReturn
 from typing import Optional
 from typing import Tuple
 from typing import Type
@@ -16,6 +24,8 @@ from fastapi.datastructures import Default
 from fastapi.datastructures import DefaultPlaceholder
 from fastapi.datastructures import FormData
 from fastapi.dependencies.models import Dependant
+from fastapi.dependencies.utils import is_async_gen_callable
+from fastapi.dependencies.utils import is_gen_callable
 from fastapi.dependencies.utils import solve_dependencies
 from fastapi.exceptions import FastAPIError
 from fastapi.exceptions import RequestValidationError
@@ -29,17 +39,304 @@ from starlette.exceptions import HTTPException
 from starlette.requests import Request
 from starlette.responses import JSONResponse
 from starlette.responses import Response
-from xsdata.formats.dataclass.context import XmlContext
-
 from .decoder import BodyDecodeError
+from .decoder import DEFAULT_XML_CONTEXT  # noqa: F401  re-exported for compatibility
 from .decoder import XmlDecoder
 from .response import XmlResponse
 
-DEFAULT_XML_CONTEXT: XmlContext = XmlContext()
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson  # noqa: F401
+    from fastapi.responses import ORJSONResponse
+
+    #: The default fallback response class for non-XML returns. orjson
+    #: serializes several times faster than the stdlib json module, so it
+    #: is preferred whenever it is installed.
+    DEFAULT_RESPONSE_CLASS: "Type[Response]" = ORJSONResponse
+except ImportError:  # pragma: no cover
+    DEFAULT_RESPONSE_CLASS = JSONResponse
+
+
+def _raise_bad_request(exc: Exception, detail: str) -> NoReturn:
+    """Log a body decode failure lazily and translate it to HTTP 400.
+
+    :param exc: the original decode failure
+    :param detail: the client facing error detail
+    """
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("body decoding failed", exc_info=exc)
+    raise HTTPException(status_code=400, detail=detail) from exc
+
+
+def _normalize_inc_ex(value: Optional[IncEx]) -> Optional[IncEx]:
+    """Normalize an include or exclude collection to a set.
+
+    Lists and tuples passed by the user would otherwise be re-hashed by
+    pydantic on every model export; the one-time conversion happens at
+    handler build time. A plain set is used because frozenset is not part
+    of the IncEx union. Mappings keep their nested structure.
+
+    :param value: the include or exclude collection, if any
+    :return: the normalized collection
+    """
+    if value is None or isinstance(value, dict):
+        return value
+    # IncEx is a union of homogeneous sets; the members of a mixed user
+    # collection cannot be narrowed statically.
+    return cast(IncEx, set(value))
+
+
+def _needs_exit_stack(dependant: Dependant) -> bool:
+    """Report whether the dependency tree contains a yield dependency.
+
+    The check mirrors the one fastapi's solve_dependencies runs per
+    sub dependency, so a dependant for which it returns False never
+    touches the exit stack.
+
+    :param dependant: the dependant whose tree is inspected
+    :return: True if any sub dependency is a (async) generator
+    """
+    for sub_dependant in dependant.dependencies:
+        call = sub_dependant.call
+        if call is not None and (
+            is_gen_callable(call) or is_async_gen_callable(call)
+        ):
+            return True
+        if _needs_exit_stack(sub_dependant):
+            return True
+    return False
+
+
+def _log_sync_dependencies(dependant: Dependant) -> None:
+    """Log every plain sync dependency in the tree once at build time.
+
+    fastapi runs each of them in the threadpool on every request; for
+    dependencies that return trivially the dispatch costs more than the
+    call, which an async def avoids.
+
+    :param dependant: the dependant whose tree is inspected
+    """
+    for sub_dependant in dependant.dependencies:
+        call = sub_dependant.call
+        if (
+            call is not None
+            and not asyncio.iscoroutinefunction(call)
+            and not is_gen_callable(call)
+            and not is_async_gen_callable(call)
+        ):
+            logger.debug(
+                "dependency %r is a plain def and runs in the threadpool "
+                "on every request; declare it async def if it does no "
+                "blocking I/O",
+                call,
+            )
+        _log_sync_dependencies(sub_dependant)
+
+
+class _NullExitStack:
+    """Stands in for the per request AsyncExitStack when the dependency tree
+    holds no yield dependencies.
+
+    solve_dependencies only uses the stack for generator dependencies,
+    so for such trees it is never entered; raising keeps a detection
+    miss loud instead of silently leaking a context.
+    """
+
+    __slots__ = ()
+
+    async def enter_async_context(self, cm: Any) -> NoReturn:
+        raise RuntimeError(
+            "unexpected context manager dependency on a route "
+            "built without an exit stack"
+        )
+
+
+_NULL_EXIT_STACK = _NullExitStack()
+
+
+def _new_sub_response() -> Response:
+    """Create the placeholder sub response used by the trivial endpoint fast
+    path, mirroring what fastapi's solve_dependencies would hand back."""
+    sub_response = Response()
+    del sub_response.headers["content-length"]
+    sub_response.status_code = None  # type: ignore[assignment]
+    return sub_response
+
+
+# The body acquisition and decode section of a generated request handler.
+# Reading the body stays outside the try blocks: transport errors must not
+# be masked as HTTP 400 and the decode try block stays zero-cost on the
+# happy path (CPython 3.11+). Empty bodies skip the decoder entirely. Only
+# BodyDecodeError maps to 400; anything else is a bug and propagates as a
+# plain server error. This variant is only emitted when streaming decode
+# is enabled via XmlDecoder.stream_threshold.
+_DECODE_SECTION = """\
+    content_length = request.headers.get("content-length")
+    body = None
+    if (
+        content_length is not None
+        and content_length.isdigit()
+        and int(content_length) >= _stream_threshold
+    ):
+        try:
+            body = await _decode_stream(request, _body_field)
+        except _BodyDecodeError as e:
+            _raise_bad_request(e, str(e))
+    else:
+        body_bytes = await request.body()
+        if body_bytes:
+            try:
+                body = await _decode_async(request, _body_field, body_bytes)
+            except _BodyDecodeError as e:
+                _raise_bad_request(e, str(e))
+"""
+
+# The default body acquisition section: every body is buffered through
+# request.body() regardless of its declared size.
+_BUFFERED_DECODE_SECTION = """\
+    body = None
+    body_bytes = await request.body()
+    if body_bytes:
+        try:
+            body = await _decode_async(request, _body_field, body_bytes)
+        except _BodyDecodeError as e:
+            _raise_bad_request(e, str(e))
+"""
+
+# The generic endpoint invocation through fastapi's dependency resolution.
+_CALL_SECTION = """\
+    raw_response, background_tasks, sub_response = await _call_endpoint(
+        request=request,
+        dependant=_dependant,
+        is_coroutine=_is_coroutine,
+        body=body,
+        dependency_overrides_provider=_overrides,
+        embed_body_fields=_embed_body_fields,
+    )
+"""
+
+# The fast path for endpoints whose only input is the decoded body: the
+# single body field is validated directly and the endpoint is called
+# without solve_dependencies and its AsyncExitStack.
+_TRIVIAL_SECTION = """\
+    if body is not None:
+        value, errors = _field_validate(body, {{}}, loc=("body",))
+        if errors:
+            error_list = errors if isinstance(errors, list) else [errors]
+            raise _RequestValidationError(_normalize_errors(error_list), body=body)
+        raw_response = await _run_endpoint_function(
+            dependant=_dependant,
+            values={{_param_name: value}},
+            is_coroutine=_is_coroutine,
+        )
+        background_tasks = None
+        sub_response = _new_sub_response()
+    else:
+{call_section}
+"""
+
+# The response finalization shared by every generated handler. The
+# serialization flags are baked into the _serialize partial at build time.
+_RETURN_SECTION = """\
+    return await _return_response(
+        raw_response=raw_response,
+        background_tasks=background_tasks,
+        sub_response=sub_response,
+        actual_response_class=_response_class,
+        status_code=_status_code,
+        serialize=_serialize,
+    )
+"""
 
 
 class XmlRoute(APIRoute):
+    #: TTL in seconds for the opt-in response cache on idempotent routes.
+    #: None (the default) disables caching; enable it by subclassing and
+    #: setting a TTL. A cache hit skips dependency resolution, the
+    #: endpoint and serialization entirely. The key covers method, path
+    #: and query string only, so routes whose responses vary on anything
+    #: else - authentication, Accept headers, cookies - must not enable
+    #: it; responses carrying Set-Cookie are never cached.
+    response_cache_ttl: ClassVar[Optional[float]] = None
+    #: Number of responses the per route cache holds before evicting the
+    #: least recently used entry.
+    response_cache_size: ClassVar[int] = 128
+
     def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        if self.body_field is not None:
+            XmlDecoder.warmup((self.body_field.type_,))
+        handler = self._build_request_handler()
+        if self.response_cache_ttl is not None and not self.methods.isdisjoint(
+            ("GET", "HEAD")
+        ):
+            handler = self._wrap_response_cache(handler)
+        return handler
+
+    def _wrap_response_cache(
+        self, handler: Callable[[Request], Coroutine[Any, Any, Response]]
+    ) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        """Wrap the generated handler with a keyed TTL response cache.
+
+        Only GET and HEAD requests are cached, keyed on method, path and
+        query string. Responses with a background task, a Set-Cookie
+        header or a non-200 status pass through uncached: a stored
+        cookie would be replayed to every later caller.
+
+        :param handler: the generated request handler
+        :return: the caching handler
+        """
+        ttl = self.response_cache_ttl
+        if ttl is None:  # pragma: no cover - the caller only wraps with a ttl
+            return handler
+        cache: "OrderedDict[Tuple[str, str, str], Tuple[float, int, Tuple[Tuple[bytes, bytes], ...], bytes]]" = (
+            OrderedDict()
+        )
+        max_entries = self.response_cache_size
+
+        async def cached_handler(
+            request: Request,
+            *,
+            _handler: Callable[
+                [Request], Coroutine[Any, Any, Response]
+            ] = handler,
+            _cache: Any = cache,
+            _monotonic: Callable[[], float] = time.monotonic,
+        ) -> Response:
+            if request.method not in ("GET", "HEAD"):
+                return await _handler(request)
+            key = (request.method, request.url.path, request.url.query)
+            now = _monotonic()
+            entry = _cache.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    _cache.move_to_end(key)
+                    response = Response(entry[3], status_code=entry[1])
+                    response.headers.raw[:] = entry[2]
+                    return response
+                del _cache[key]
+            response = await _handler(request)
+            if (
+                response.status_code == 200
+                and response.background is None
+                and "set-cookie" not in response.headers
+                and isinstance(getattr(response, "body", None), bytes)
+            ):
+                _cache[key] = (
+                    now + ttl,
+                    response.status_code,
+                    tuple(response.headers.raw),
+                    response.body,
+                )
+                if len(_cache) > max_entries:
+                    _cache.popitem(last=False)
+            return response
+
+        return cached_handler
+
+    def _build_request_handler(
+        self,
+    ) -> Callable[[Request], Coroutine[Any, Any, Response]]:
         return self.get_request_handler(
             dependant=self.dependant,
             body_field=self.body_field,
@@ -61,16 +358,9 @@ class XmlRoute(APIRoute):
         raw_response: Any,
         background_tasks: Optional[BackgroundTasks],
         sub_response: Response,
-        is_coroutine: bool,
         actual_response_class: "Type[Response]",
+        serialize: Callable[..., Any],
         status_code: Optional[int] = None,
-        response_field: Optional[ModelField] = None,
-        response_model_include: Optional[IncEx] = None,
-        response_model_exclude: Optional[IncEx] = None,
-        response_model_by_alias: bool = True,
-        response_model_exclude_unset: bool = False,
-        response_model_exclude_defaults: bool = False,
-        response_model_exclude_none: bool = False,
     ) -> Response:  # pragma: nocover
         # Repository: https://github.com/tiangolo/fastapi
         # fastapi's license copy is blow.
@@ -102,30 +392,19 @@ class XmlRoute(APIRoute):
             response = raw_response
         else:
             response_args: Dict[str, Any] = {"background": background_tasks}
-            # If status_code was set, use it, otherwise use the default from the
-            # response class, in the case of redirect it's 307
-            current_status_code = (
-                status_code if status_code else sub_response.status_code
-            )
+            # A status set on the sub response wins over the route's one;
+            # without either, the response class default applies (307 for
+            # redirects).
+            current_status_code = sub_response.status_code or status_code
             if current_status_code is not None:
                 response_args["status_code"] = current_status_code
-            if sub_response.status_code:
-                response_args["status_code"] = sub_response.status_code
-            content = await serialize_response(
-                field=response_field,
-                response_content=raw_response,
-                include=response_model_include,
-                exclude=response_model_exclude,
-                by_alias=response_model_by_alias,
-                exclude_unset=response_model_exclude_unset,
-                exclude_defaults=response_model_exclude_defaults,
-                exclude_none=response_model_exclude_none,
-                is_coroutine=is_coroutine,
-            )
+            content = await serialize(response_content=raw_response)
             response = actual_response_class(content, **response_args)
             if not is_body_allowed_for_status_code(response.status_code):
                 response.body = b""
-            response.headers.raw.extend(sub_response.headers.raw)
+            sub_headers = sub_response.headers.raw
+            if sub_headers:
+                response.headers.raw.extend(sub_headers)
 
         if response is None:
             raise FastAPIError(
@@ -169,7 +448,15 @@ class XmlRoute(APIRoute):
         # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
         # THE SOFTWARE.
         assert dependant.call is not None, "dependant.call must be a function"
-        is_coroutine = asyncio.iscoroutinefunction(dependant.call)
+        is_coroutine: Optional[bool] = getattr(
+            dependant.call, "__fastapi_xml_is_coro__", None
+        )
+        if is_coroutine is None:
+            is_coroutine = asyncio.iscoroutinefunction(dependant.call)
+            try:
+                dependant.call.__fastapi_xml_is_coro__ = is_coroutine  # type: ignore[attr-defined]
+            except AttributeError:  # pragma: nocover
+                pass
         is_body_form = body_field is not None and isinstance(
             body_field.field_info, params.Form
         )
@@ -240,73 +527,42 @@ class XmlRoute(APIRoute):
             return raw_response, solved_result.background_tasks, solved_result.response
 
     @staticmethod
-    async def _request_handler(
+    async def _mod_fastapi_call_endpoint_no_stack(
         *,
         request: Request,
         dependant: Dependant,
-        body_field: Optional[ModelField],
         is_coroutine: bool,
-        actual_response_class: "Type[Response]",
-        status_code: Optional[int] = None,
-        response_field: Optional[ModelField] = None,
-        response_model_include: Optional[IncEx] = None,
-        response_model_exclude: Optional[IncEx] = None,
-        response_model_by_alias: bool = True,
-        response_model_exclude_unset: bool = False,
-        response_model_exclude_defaults: bool = False,
-        response_model_exclude_none: bool = False,
+        body: Optional[Union[Dict[str, Any], FormData]],
         dependency_overrides_provider: Optional[Any] = None,
         embed_body_fields: bool = False,
-    ) -> Response:
-        body: Any = None
-        if body_field:
-            body_bytes = await request.body()
-            try:
-                body = XmlDecoder.decode(request, body_field, body_bytes)
-            except BodyDecodeError as e:  # pragma: nocover
-                raise HTTPException(status_code=400, detail=str(e)) from e
-            except Exception:  # pragma: nocover
-                # run_decoder cannot trigger this exception handler since run_decoder
-                # raises BodyDecodeError always. However, better safe than sorry
-                raise HTTPException(
-                    status_code=400, detail="There was an error parsing the body"
-                )
-
-        (
-            raw_response,
-            background_tasks,
-            sub_response,
-        ) = await XmlRoute._mod_fastapi_call_endpoint(
+    ) -> Tuple[Any, Optional[BackgroundTasks], Response]:  # pragma: no cover
+        # Derived from _mod_fastapi_call_endpoint above; fastapi's license
+        # applies, see the copy there. This variant serves dependants
+        # without yield dependencies: solve_dependencies never touches the
+        # stack for those, so the per request AsyncExitStack and its two
+        # coroutine frames are skipped.
+        solved_result = await solve_dependencies(
             request=request,
             dependant=dependant,
-            is_coroutine=is_coroutine,
             body=body,
             dependency_overrides_provider=dependency_overrides_provider,
+            async_exit_stack=_NULL_EXIT_STACK,  # type: ignore[arg-type]
             embed_body_fields=embed_body_fields,
         )
+        errors = solved_result.errors
 
-        if (
-            not isinstance(raw_response, Response)
-            and isinstance(actual_response_class, type)
-            and issubclass(actual_response_class, XmlResponse)
-        ):
-            raw_response = actual_response_class(content=raw_response)
-
-        return await XmlRoute._mod_fastapi_return_response(
-            raw_response=raw_response,
-            background_tasks=background_tasks,
-            sub_response=sub_response,
-            is_coroutine=is_coroutine,
-            actual_response_class=actual_response_class,
-            status_code=status_code,
-            response_field=response_field,
-            response_model_include=response_model_include,
-            response_model_exclude=response_model_exclude,
-            response_model_by_alias=response_model_by_alias,
-            response_model_exclude_unset=response_model_exclude_unset,
-            response_model_exclude_defaults=response_model_exclude_defaults,
-            response_model_exclude_none=response_model_exclude_none,
-        )
+        if errors:
+            validation_error = RequestValidationError(
+                _normalize_errors(errors), body=body
+            )
+            raise validation_error
+        else:
+            raw_response = await run_endpoint_function(
+                dependant=dependant,
+                values=solved_result.values,
+                is_coroutine=is_coroutine,
+            )
+            return raw_response, solved_result.background_tasks, solved_result.response
 
     @staticmethod
     def get_request_handler(
@@ -314,7 +570,7 @@ class XmlRoute(APIRoute):
         body_field: Optional[ModelField] = None,
         status_code: Optional[int] = None,
         response_class: Union["Type[Response]", DefaultPlaceholder] = Default(
-            JSONResponse
+            DEFAULT_RESPONSE_CLASS
         ),
         response_field: Optional[ModelField] = None,
         response_model_include: Optional[IncEx] = None,
@@ -332,6 +588,13 @@ class XmlRoute(APIRoute):
 
         Furthermore, any API endpoint may use :class:`XmlResponse`
         to serialize any data into a non-json format.
+
+        The handler is generated per route: the route shape (body field,
+        trivial dependency graph, response class) is inspected once and a
+        purpose built coroutine containing only the applicable sections is
+        compiled, the same way :mod:`fastapi_xml.decoder` compiles its per
+        class walkers. Every constant is bound as a keyword default so the
+        hot path runs on fast locals.
         """
 
         (
@@ -341,28 +604,103 @@ class XmlRoute(APIRoute):
         ) = XmlRoute._original_fastapi_prepare_request_handler(
             dependant=dependant, body_field=body_field, response_class=response_class
         )
+        is_xml_response_class = isinstance(actual_response_class, type) and issubclass(
+            actual_response_class, XmlResponse
+        )
+        if logger.isEnabledFor(logging.DEBUG):
+            _log_sync_dependencies(dependant)
 
-        wrapped_func = XmlRoute._request_handler
+        trivial_body_param: Optional[ModelField] = None
+        if (
+            body_field is not None
+            and not embed_body_fields
+            and len(dependant.body_params) == 1
+            and not dependant.dependencies
+            and not dependant.path_params
+            and not dependant.query_params
+            and not dependant.header_params
+            and not dependant.cookie_params
+            and not dependant.security_requirements
+            and dependant.request_param_name is None
+            and dependant.websocket_param_name is None
+            and dependant.http_connection_param_name is None
+            and dependant.response_param_name is None
+            and dependant.background_tasks_param_name is None
+            and dependant.security_scopes_param_name is None
+        ):
+            trivial_body_param = dependant.body_params[0]
 
-        async def wrapper(request: Request) -> Any:
-            return await wrapped_func(
-                request=request,
-                dependant=dependant,
+        env: Dict[str, Any] = {
+            "_body_field": body_field,
+            "_stream_threshold": XmlDecoder.stream_threshold,
+            "_decode_stream": XmlDecoder.decode_stream,
+            "_decode_async": XmlDecoder.decode_async,
+            "_BodyDecodeError": BodyDecodeError,
+            "_raise_bad_request": _raise_bad_request,
+            "_call_endpoint": (
+                XmlRoute._mod_fastapi_call_endpoint
+                if _needs_exit_stack(dependant)
+                else XmlRoute._mod_fastapi_call_endpoint_no_stack
+            ),
+            "_return_response": XmlRoute._mod_fastapi_return_response,
+            "_run_endpoint_function": run_endpoint_function,
+            "_normalize_errors": _normalize_errors,
+            "_RequestValidationError": RequestValidationError,
+            "_new_sub_response": _new_sub_response,
+            "_field_validate": (
+                trivial_body_param.validate if trivial_body_param else None
+            ),
+            "_param_name": trivial_body_param.name if trivial_body_param else None,
+            "_dependant": dependant,
+            "_is_coroutine": is_coroutine,
+            "_overrides": dependency_overrides_provider,
+            "_embed_body_fields": embed_body_fields,
+            "_Response": Response,
+            "_response_class": actual_response_class,
+            "_status_code": status_code,
+            # All constant serialization arguments are bound once; the hot
+            # path only supplies the response content.
+            "_serialize": partial(
+                serialize_response,
+                field=response_field,
+                include=_normalize_inc_ex(response_model_include),
+                exclude=_normalize_inc_ex(response_model_exclude),
+                by_alias=response_model_by_alias,
+                exclude_unset=response_model_exclude_unset,
+                exclude_defaults=response_model_exclude_defaults,
+                exclude_none=response_model_exclude_none,
                 is_coroutine=is_coroutine,
-                body_field=body_field,
-                actual_response_class=actual_response_class,
-                status_code=status_code,
-                response_field=response_field,
-                response_model_include=response_model_include,
-                response_model_exclude=response_model_exclude,
-                response_model_by_alias=response_model_by_alias,
-                response_model_exclude_unset=response_model_exclude_unset,
-                response_model_exclude_defaults=response_model_exclude_defaults,
-                response_model_exclude_none=response_model_exclude_none,
-                dependency_overrides_provider=dependency_overrides_provider,
-                embed_body_fields=embed_body_fields,
-            )
+            ),
+        }
 
-        wrapper.__wrapped_func__ = wrapped_func  # type: ignore[attr-defined]
+        sections: List[str] = []
+        if body_field is not None:
+            if XmlDecoder.stream_threshold is not None:
+                sections.append(_DECODE_SECTION)
+            else:
+                sections.append(_BUFFERED_DECODE_SECTION)
+        else:
+            sections.append("    body = None\n")
+        if trivial_body_param is not None:
+            indented_call = "".join(
+                "    " + line for line in _CALL_SECTION.splitlines(keepends=True)
+            )
+            sections.append(_TRIVIAL_SECTION.format(call_section=indented_call))
+        else:
+            sections.append(_CALL_SECTION)
+        if is_xml_response_class:
+            # The isinstance check stays even for annotated return types:
+            # fastapi lets an endpoint return a Response regardless of its
+            # annotation, and wrapping one would serialize the Response
+            # object itself.
+            sections.append(
+                "    if not isinstance(raw_response, _Response):\n"
+                "        raw_response = _response_class(content=raw_response)\n"
+            )
+        sections.append(_RETURN_SECTION)
 
-        return wrapper
+        params = ", ".join(f"{name}={name}" for name in env)
+        source = f"async def handler(request, *, {params}):\n" + "".join(sections)
+        namespace = dict(env)
+        exec(compile(source, "<fastapi_xml.route>", "exec"), namespace)  # noqa: S102
+        return namespace["handler"]
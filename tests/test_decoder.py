@@ -1,4 +1,5 @@
 #  type: ignore
+import asyncio
 import unittest
 from dataclasses import dataclass
 from dataclasses import field
@@ -49,15 +50,19 @@ class TestXmlDecoder(unittest.TestCase):
         self.app.include_router(router)
         self.api_routes = [r for r in self.app.routes if isinstance(r, APIRoute)]
 
-    def test_get_parser(self) -> None:
+    def test_thread_local_parser(self) -> None:
         """
-        The test_get_parser function tests the get_parser function in the
-        XmlDecoder class.
+        The test_thread_local_parser function tests the thread local parser
+        accessor.
 
-        It asserts that an instance of XmlParser is returned.
+        It asserts that an XmlParser is returned and reused within the
+        same thread.
         """
-        result = XmlDecoder.get_parser()
+        from fastapi_xml.decoder import _get_parser
+
+        result = _get_parser()
         self.assertIsInstance(result, XmlParser)
+        self.assertIs(result, _get_parser())
 
     def test_decode__decode_body(self) -> None:
         """
@@ -86,6 +91,195 @@ class TestXmlDecoder(unittest.TestCase):
         self.assertTrue("x" in test_result)
         self.assertEqual(test_result["x"], "test")
 
+    def test_decode__nested_model(self) -> None:
+        """
+        This function tests the generated per class walkers of
+        :meth:`fastapi_xml.XmlDecoder.decode` with a nested dataclass.
+
+        The nested instance must be converted into a nested mapping.
+        """
+
+        @dataclass
+        class Inner:
+            y: str = field(metadata={"type": "Element"})
+
+        @dataclass
+        class Outer:
+            inner: Inner = field(metadata={"type": "Element"})
+
+        router = APIRouter()
+
+        @router.get("/nested")
+        def endpoint_nested(x: Outer = XmlBody()) -> None:  # pragma: no cover
+            """dummy endpoint."""
+            pass
+
+        app = FastAPI()
+        app.include_router(router)
+        route = [
+            r for r in app.routes if isinstance(r, APIRoute) and r.path == "/nested"
+        ][0]
+
+        test_scope: Dict[str, Any] = {
+            "type": "http",
+            "query_string": "",
+            "headers": [(b"content-type", b"text/xml")],
+        }
+        test_request = Request(scope=test_scope)
+        test_body = b"<Outer><inner><y>test</y></inner></Outer>"
+        test_result = XmlDecoder.decode(test_request, route.body_field, test_body)
+        self.assertEqual(test_result, {"inner": {"y": "test"}})
+
+    def test_decode__cache_hit(self) -> None:
+        """
+        This function tests the decode cache of
+        :meth:`fastapi_xml.XmlDecoder.decode`.
+
+        Decoding the same body twice must return equal but distinct
+        mappings, so a cache hit cannot leak mutations between requests.
+        """
+        test_scope: Dict[str, Any] = {
+            "type": "http",
+            "query_string": "",
+            "headers": [(b"content-type", b"text/xml")],
+        }
+        route_model = [r for r in self.api_routes if r.path == "/model"][0]
+        test_request = Request(scope=test_scope)
+        test_body = b"<Model><x>cached</x></Model>"
+        test_field = route_model.body_field
+        first = XmlDecoder.decode(test_request, test_field, test_body)
+        second = XmlDecoder.decode(test_request, test_field, test_body)
+        self.assertEqual(first, second)
+        self.assertIsNot(first, second)
+
+    def test_decode__cache_isolation_nested(self) -> None:
+        """
+        This function tests the decode cache of
+        :meth:`fastapi_xml.XmlDecoder.decode` with a nested dataclass.
+
+        Mutating a nested mapping of one decode result must not leak
+        into the result of a later decode of the same body.
+        """
+
+        @dataclass
+        class Inner:
+            y: str = field(metadata={"type": "Element"})
+
+        @dataclass
+        class Outer:
+            inner: Inner = field(metadata={"type": "Element"})
+
+        router = APIRouter()
+
+        @router.get("/nested")
+        def endpoint_nested(x: Outer = XmlBody()) -> None:  # pragma: no cover
+            """dummy endpoint."""
+            pass
+
+        app = FastAPI()
+        app.include_router(router)
+        route = [
+            r for r in app.routes if isinstance(r, APIRoute) and r.path == "/nested"
+        ][0]
+
+        test_scope: Dict[str, Any] = {
+            "type": "http",
+            "query_string": "",
+            "headers": [(b"content-type", b"text/xml")],
+        }
+        test_request = Request(scope=test_scope)
+        test_body = b"<Outer><inner><y>test</y></inner></Outer>"
+        first = XmlDecoder.decode(test_request, route.body_field, test_body)
+        first["inner"]["y"] = "poisoned"
+        second = XmlDecoder.decode(test_request, route.body_field, test_body)
+        self.assertEqual(second, {"inner": {"y": "test"}})
+
+    def test_decode_into_pydantic(self) -> None:
+        """
+        The test_decode_into_pydantic function tests the
+        :meth:`fastapi_xml.XmlDecoder.decode_into_pydantic` method.
+
+        It asserts that the decoded body is returned as a validated
+        instance instead of a mapping.
+        """
+        test_scope: Dict[str, Any] = {
+            "type": "http",
+            "query_string": "",
+            "headers": [(b"content-type", b"text/xml")],
+        }
+        route_model = [r for r in self.api_routes if r.path == "/model"][0]
+        test_request = Request(scope=test_scope)
+        test_body = b"<Model><x>test</x></Model>"
+        test_field = route_model.body_field
+        test_result = XmlDecoder.decode_into_pydantic(
+            test_request, test_field, test_body
+        )
+        self.assertNotIsInstance(test_result, dict)
+        self.assertEqual(test_result.x, "test")
+
+    def test_decode_batch(self) -> None:
+        """
+        The test_decode_batch function tests the
+        :meth:`fastapi_xml.XmlDecoder.decode_batch` method.
+
+        It asserts that each body decodes to its own mapping in input
+        order.
+        """
+
+        @dataclass
+        class BatchModel:
+            x: str = field(metadata={"type": "Element"})
+
+        bodies = [
+            b"<BatchModel><x>one</x></BatchModel>",
+            b"<BatchModel><x>two</x></BatchModel>",
+        ]
+        result = XmlDecoder.decode_batch(bodies, BatchModel)
+        self.assertEqual(result, [{"x": "one"}, {"x": "two"}])
+
+    def test_decode_stream(self) -> None:
+        """
+        The test_decode_stream function tests the
+        :meth:`fastapi_xml.XmlDecoder.decode_stream` method.
+
+        The body arrives in several chunks from the ASGI receive
+        channel and must decode to the same mapping as
+        :meth:`fastapi_xml.XmlDecoder.decode`.
+        """
+        messages = [
+            {"type": "http.request", "body": b"<Model><x>te", "more_body": True},
+            {"type": "http.request", "body": b"st</x></Model>", "more_body": False},
+        ]
+
+        async def receive() -> Dict[str, Any]:
+            return messages.pop(0)
+
+        test_scope: Dict[str, Any] = {
+            "type": "http",
+            "query_string": "",
+            "headers": [(b"content-type", b"text/xml")],
+        }
+        route_model = [r for r in self.api_routes if r.path == "/model"][0]
+        test_request = Request(scope=test_scope, receive=receive)
+        test_field = route_model.body_field
+        test_result = asyncio.run(XmlDecoder.decode_stream(test_request, test_field))
+        self.assertIsInstance(test_result, dict)
+        self.assertEqual(test_result["x"], "test")
+
+    def test_decode_stream__return_none_if_model_is_not_a_dataclass(self) -> None:
+        """
+        This function tests the :meth:`fastapi_xml.XmlDecoder.decode_stream`
+        method.
+
+        It validates that the method returns `None` for non dataclass
+        models without touching the stream.
+        """
+        route_dclazz = [r for r in self.api_routes if r.path == "/dclazz"][0]
+        test_scope = {"type": "http", "query_string": "", "headers": []}
+        test_field = route_dclazz.body_field
+        request = Request(scope=test_scope)
+        self.assertIsNone(asyncio.run(XmlDecoder.decode_stream(request, test_field)))
+
     def test_decode__return_non_if_model_is_not_a_dataclass(self) -> None:
         """
         This function tests the :meth:`fastapi_xml.XmlDecoder.decode` method.
@@ -121,3 +315,48 @@ class TestXmlDecoder(unittest.TestCase):
         self.assertRaises(
             BodyDecodeError, XmlDecoder.decode, test_request, test_field, b"invalid"
         )
+
+    def test_decode__missing_required_element(self) -> None:
+        """
+        This function tests :meth:`XmlDecoder.decode` with a well formed
+        document that misses a required element.
+
+        xsdata reports the failed bind as a plain TypeError; the decoder
+        must wrap it in BodyDecodeError so the handler answers with HTTP
+        400 instead of a server error.
+        """
+        route_model = [r for r in self.api_routes if r.path == "/model"][0]
+        test_field = route_model.body_field
+        test_scope = {
+            "type": "http",
+            "query_string": "",
+            "headers": [(b"content-type", b"text/xml")],
+        }
+        test_request = Request(scope=test_scope)
+        self.assertRaises(
+            BodyDecodeError,
+            XmlDecoder.decode,
+            test_request,
+            test_field,
+            b"<Model></Model>",
+        )
+
+    def test_decode__body_too_large(self) -> None:
+        """
+        This function tests the :meth:`XmlDecoder.decode` body size guard.
+
+        A body above max_body_bytes must fail fast with a
+        BodyDecodeError instead of being handed to the parser.
+        """
+        route_model = [r for r in self.api_routes if r.path == "/model"][0]
+        test_field = route_model.body_field
+        test_scope = {
+            "type": "http",
+            "query_string": "",
+            "headers": [(b"content-type", b"text/xml")],
+        }
+        test_request = Request(scope=test_scope)
+        test_body = b"x" * (XmlDecoder.max_body_bytes + 1)
+        self.assertRaises(
+            BodyDecodeError, XmlDecoder.decode, test_request, test_field, test_body
+        )
@@ -649,3 +649,22 @@ class OpenAPIXmlExtensionTests(unittest.TestCase):
         self.assertFalse(openapi.add_openapi_xml_schema(test_app, test_openapi))
         test_openapi.components = Components()
         self.assertFalse(openapi.add_openapi_xml_schema(test_app, test_openapi))
+
+    def test_build_model_xml_schema__cache(self) -> None:
+        """
+        The test_build_model_xml_schema__cache function tests the
+        :func:`fastapi_xml.openapi._build_model_xml_schema` function.
+
+        Building the schema twice for the same model and namespace map
+        must return the cached schema object.
+        """
+
+        @dataclass
+        class CachedModel:
+            x: str = field(metadata={"type": "Element"})
+
+        model = pydantic_dataclass(CachedModel)
+        first = openapi._build_model_xml_schema(model, {})
+        second = openapi._build_model_xml_schema(model, {})
+        self.assertIsInstance(first, Schema)
+        self.assertIs(first, second)
@@ -1,4 +1,5 @@
 #  type: ignore
+import asyncio
 import unittest
 from dataclasses import dataclass
 from dataclasses import field
@@ -9,6 +10,7 @@ from fastapi.routing import APIRoute
 from pydantic import BaseModel
 
 from fastapi_xml.decoder import XmlParser
+from fastapi_xml.response import StreamingXmlResponse
 from fastapi_xml.response import XmlResponse
 from fastapi_xml.response import XmlSerializer
 from fastapi_xml.xmlbody import XmlBody
@@ -86,3 +88,62 @@ class TestXmlResponse(unittest.TestCase):
         parsed_obj = XmlParser().from_bytes(test_body, clazz=Dummy)
         self.assertIsInstance(parsed_obj, Dummy)
         self.assertEqual(parsed_obj.x, test_obj.x)
+
+    def test_render_cache(self) -> None:
+        """
+        This function tests the opt-in render cache of
+        :meth:`fastapi_xml.response.XmlResponse.render`.
+
+        Rendering equal payloads twice must serialize only once and
+        return the same document.
+        """
+
+        @dataclass
+        class Dummy:
+            x: str = field(metadata={"type": "Element"})
+
+        calls = []
+        real_serializer = XmlSerializer()
+
+        class CountingSerializer:
+            def write(self, out, obj, ns_map=None):
+                calls.append(1)
+                real_serializer.write(out, obj, ns_map=ns_map)
+
+        class CachedResponse(XmlResponse):
+            render_cache_size = 8
+            serializer = CountingSerializer()
+
+        first = CachedResponse(content=Dummy(x="test")).body
+        second = CachedResponse(content=Dummy(x="test")).body
+        self.assertEqual(first, second)
+        self.assertEqual(len(calls), 1)
+
+        parsed_obj = XmlParser().from_bytes(second, clazz=Dummy)
+        self.assertEqual(parsed_obj.x, "test")
+
+    def test_streaming_response(self) -> None:
+        """
+        The test_streaming_response function tests the
+        :class:`fastapi_xml.response.StreamingXmlResponse` class.
+
+        The chunks yielded by the body iterator must join into the same
+        document a plain render would produce.
+        """
+
+        @dataclass
+        class Dummy:
+            x: str = field(metadata={"type": "Element"})
+
+        test_obj = Dummy(x="test")
+        test_response = StreamingXmlResponse(content=test_obj)
+
+        async def collect() -> bytes:
+            parts = [chunk async for chunk in test_response.body_iterator]
+            return b"".join(parts)
+
+        test_body = asyncio.run(collect())
+        self.assertIsInstance(test_body, bytes)
+        parsed_obj = XmlParser().from_bytes(test_body, clazz=Dummy)
+        self.assertIsInstance(parsed_obj, Dummy)
+        self.assertEqual(parsed_obj.x, test_obj.x)
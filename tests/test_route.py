@@ -7,6 +7,8 @@ from unittest import TestCase
 
 from fastapi import FastAPI
 from fastapi import Request
+from fastapi import Response
+from fastapi.responses import JSONResponse
 from fastapi.routing import APIRoute
 from xsdata.formats.dataclass.parsers import XmlParser
 from xsdata.formats.dataclass.serializers import XmlSerializer
@@ -106,3 +108,69 @@ class FastAPITests(TestCase):
         assert isinstance(rsp_obj, ResponseModel)
         self.assertEqual(type(rsp_obj), ResponseModel)
         self.assertEqual(rsp_obj.x, "pong")
+
+    def test_response_cache(self) -> None:
+        """
+        This function tests the opt-in response cache of
+        :class:`fastapi_xml.route.XmlRoute`.
+
+        The second GET for the same path must be served from the cache
+        without invoking the endpoint again.
+        """
+
+        class CachedXmlRoute(XmlRoute):
+            response_cache_ttl = 60.0
+
+        path = "/cached"
+        calls: list = []
+        self.app.router.route_class = CachedXmlRoute
+
+        @self.app.router.get(path, response_model=ResponseModel)
+        def endpoint() -> ResponseModel:
+            calls.append(1)
+            return ResponseModel(x="pong")
+
+        route = [
+            r
+            for r in self.app.routes
+            if isinstance(r, APIRoute) and r.path_regex.match(path)
+        ][0]
+        request_handler = route.get_route_handler()
+        scope = {
+            "type": "http",
+            "method": "GET",
+            "path": path,
+            "query_string": b"",
+            "headers": [],
+        }
+        first = asyncio.run(request_handler(Request(scope=scope)))
+        second = asyncio.run(request_handler(Request(scope=scope)))
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(first.body, second.body)
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(
+            second.headers.get("content-type"), first.headers.get("content-type")
+        )
+
+        # responses that set a cookie must never be served from the cache
+        cookie_path = "/cached_cookie"
+        cookie_calls: list = []
+
+        @self.app.router.get(
+            cookie_path, response_model=ResponseModel, response_class=JSONResponse
+        )
+        def cookie_endpoint(response: Response) -> ResponseModel:
+            cookie_calls.append(1)
+            response.set_cookie("sid", "secret")
+            return ResponseModel(x="pong")
+
+        cookie_route = [
+            r
+            for r in self.app.routes
+            if isinstance(r, APIRoute) and r.path_regex.match(cookie_path)
+        ][0]
+        cookie_handler = cookie_route.get_route_handler()
+        cookie_scope = dict(scope, path=cookie_path)
+        asyncio.run(cookie_handler(Request(scope=cookie_scope)))
+        asyncio.run(cookie_handler(Request(scope=cookie_scope)))
+        self.assertEqual(len(cookie_calls), 2)